@@ -1,13 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
+import asyncio
+import csv
+import functools
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 import re
 import random
 import logging
-from urllib.parse import urljoin, urlparse
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +19,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger('conditioner_scraper')
 
+# HTTP status codes to retry on, with exponential backoff between attempts
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 2
+
+# Connection pool size shared across all sites, and the number of requests
+# allowed in flight to any single host
+MAX_CONNECTIONS = 64
+MAX_REQUESTS_PER_HOST = 8
+
+# Stop reading a response body after this many bytes
+MAX_BYTES = 1_500_000
+
+# Site-specific CSS selectors and rules, keyed by domain without www
+_SITE_RULES = {
+    'sephora.com': {
+        'search_url': 'https://www.sephora.com/search?keyword=hair%20conditioner',
+        'product_links': '.css-ix8km1',
+        'product_name': '.css-1pgnl76',
+        'company': '.css-cjz2sh',
+        'ingredients_selector': '#ingredients',
+        'pagination': '.css-1kceze8'
+    },
+    'ulta.com': {
+        'search_url': 'https://www.ulta.com/hair-care-products/hair-treatments/conditioner?N=26yd',
+        'product_links': '.ProductCard__link',
+        'product_name': '.Text-ds--title-3',
+        'company': '.Text-ds--title-5',
+        'ingredients_selector': '#product-ingredients',
+        'pagination': '.Pagination__page-link'
+    },
+    'sallybeauty.com': {
+        'search_url': 'https://www.sallybeauty.com/hair-care/shop-by-product/conditioner/',
+        'product_links': '.product-tile-link',
+        'product_name': '.product-name',
+        'company': '.product-brand',
+        'ingredients_selector': '.product-ingredients',
+        'pagination': '.page-next'
+    },
+    'target.com': {
+        'search_url': 'https://www.target.com/c/conditioner-hair-care-beauty/-/N-5xu0i',
+        'product_links': 'a[data-test="product-title"]',
+        'product_name': 'h1[data-test="product-title"]',
+        'company': '[data-test="product-brand"]',
+        'ingredients_selector': '[data-test="ingredients-content"]',
+        'pagination': '.iUWCMa'
+    }
+}
+
+# Columns written to the output CSV, in order
+CSV_FIELDS = ['product_name', 'company', 'ingredients', 'source_url', 'retailer']
+
+# Precompiled patterns for cleaning up scraped ingredient text
+_WS_RE = re.compile(r'\s+')
+_INGR_PREFIX_RE = re.compile(r'^\s*ingredients\s*:\s*', re.I)
+
+# Canned page body returned by _make_request in mock mode
+_MOCK_HTML = b'<html><body><div class="product-name">Mock Product</div><div class="product-brand">Mock Brand</div></body></html>'
+
+# Pagination link texts that mean "next page"
+_NEXT_TOKENS = frozenset(['next', '›', '>', '»'])
+
+# Values used to build varied mock product data, and the pattern for the
+# last digit of a mock URL that picks between them
+_LAST_DIGIT_RE = re.compile(r'.*(\d)', re.S)
+_MOCK_BRANDS = ('Pantene', 'Herbal Essences', 'Dove', 'TRESemmé', 'L\'Oréal', 'Garnier', 'Head & Shoulders', 'Aussie')
+_MOCK_TYPES = ('Moisturizing', 'Volumizing', 'Color Protection', 'Damage Repair', 'Curl Defining', 'Smoothing')
+
+@functools.lru_cache(maxsize=8192)
+def _netloc(url):
+    """
+    Get the network location of an absolute URL
+
+    Equivalent to urlparse(url).netloc for the http(s) URLs handled here,
+    without building a ParseResult on every call.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Host (and port, if any) portion of the URL
+    """
+    start = url.find('//')
+    if start < 0:
+        return ''
+    start += 2
+    end = len(url)
+    for sep in '/?#':
+        i = url.find(sep, start)
+        if 0 <= i < end:
+            end = i
+    return url[start:end]
+
 class ConditionerScraper:
     def __init__(self, retail_sites, mock_mode=False):
         """
@@ -34,42 +129,91 @@ class ConditionerScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
             'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
         ]
-        self.headers = {
-            'User-Agent': self._get_random_user_agent()
-        }
+        # One complete browser-like header set per user agent; requests pick
+        # one at random instead of mutating shared state
+        self._header_variants = [
+            {
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Upgrade-Insecure-Requests': '1'
+            }
+            for user_agent in self.user_agents
+        ]
         self.results = []
-        self.session = self._create_session()
+        # CSV output streamed by run_async, open only while a run is writing
+        self._csv_file = None
+        self._writer = None
+        # Per-host request caps, shared HTTP client and parsing pool, all
+        # created per 'async with' so each event loop gets its own
+        self._host_sems = None
+        self._client = None
+        self._executor = None
+
+    async def __aenter__(self):
+        """
+        Open the shared HTTP client and parsing pool
+
+        One client is reused for every site and product for the lifetime of
+        the scraper, so TLS sessions and HTTP/2 connections carry over.
 
-    def _get_random_user_agent(self):
+        Returns:
+            The scraper itself
+        """
+        # Cap concurrent requests per host so one retailer is never hammered.
+        # Semaphores bind to the loop they first wait on, so make fresh ones
+        self._host_sems = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+        self._client = self._create_session()
+        # Parsing is CPU-bound, so spread it across one process per core
+        self._executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        Close the shared HTTP client and parsing pool
+        """
+        try:
+            await self._client.aclose()
+        finally:
+            self._executor.shutdown()
+            self._host_sems = None
+            self._client = None
+            self._executor = None
+
+    def _get_random_headers(self):
         """
-        Get a random user agent from the list
+        Get a random set of request headers
 
         Returns:
-            Random user agent string
+            Header dictionary with a random user agent
         """
-        return random.choice(self.user_agents)
+        return random.choice(self._header_variants)
 
     def _create_session(self):
         """
-        Create a requests session with retry capabilities
+        Create an HTTP/2 client shared by every request in a run
+
+        Requests to the same retailer are multiplexed over one connection.
+        Connection failures are retried by the transport; status-based
+        retries are handled in _make_request.
 
         Returns:
-            Requests session with retry configuration
-        """
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=5,  # Increased maximum number of retries
-            backoff_factor=2,  # Increased exponential backoff factor
-            status_forcelist=[429, 500, 502, 503, 504],  # HTTP status codes to retry on
-            allowed_methods=["GET"],
-            respect_retry_after_header=True
+            httpx.AsyncClient with HTTP/2 enabled
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            # Keep every pooled connection alive so no retailer's connection
+            # is dropped and re-handshaked between bursts
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=30.0
+            ),
+            retries=MAX_RETRIES
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+        return httpx.AsyncClient(transport=transport, timeout=20.0, follow_redirects=True)
 
-    def _make_request(self, url):
+    async def _make_request(self, url):
         """
         Make a request with retry capabilities and rotating user agents
 
@@ -77,85 +221,75 @@ class ConditionerScraper:
             url: URL to request
 
         Returns:
-            Response object or mock response if in mock mode
+            Response body bytes (capped at MAX_BYTES), or mock HTML if in mock mode
         """
         # If in mock mode, return a mock response
         if self.mock_mode:
             logger.info(f"Mock mode: Simulating request to {url}")
-            from unittest.mock import MagicMock
-            mock_response = MagicMock()
-            mock_response.text = '<html><body><div class="product-name">Mock Product</div><div class="product-brand">Mock Brand</div></body></html>'
-            mock_response.status_code = 200
-            return mock_response
+            return _MOCK_HTML
 
-        # Update user agent for each request
-        self.headers['User-Agent'] = self._get_random_user_agent()
+        # Rotate user agent for each request
+        headers = self._get_random_headers()
 
         try:
-            # Add additional headers to appear more like a browser
-            self.headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-            self.headers['Accept-Language'] = 'en-US,en;q=0.5'
-            self.headers['Connection'] = 'keep-alive'
-            self.headers['Upgrade-Insecure-Requests'] = '1'
-
-            # Increased timeout
-            response = self.session.get(url, headers=self.headers, timeout=20)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
+            async with self._host_sems[_netloc(url)]:
+                # Add a short randomized delay to be respectful
+                await asyncio.sleep(random.uniform(0.2, 0.6))
+
+                for attempt in range(MAX_RETRIES + 1):
+                    async with self._client.stream('GET', url, headers=headers) as response:
+                        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                            response.raise_for_status()
+                            return await self._read_capped(response)
+
+                        # Respect Retry-After when the server sends one
+                        retry_after = response.headers.get('Retry-After', '')
+                        delay = int(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * (2 ** attempt)
+                        logger.warning(f"Got {response.status_code} for {url}, retrying in {delay}s")
+                    await asyncio.sleep(delay)
+        except httpx.HTTPError as e:
             logger.error(f"Request error for {url}: {str(e)}")
             raise
 
-    def get_site_specific_rules(self, domain):
+    @staticmethod
+    async def _read_capped(response):
+        """
+        Read a streamed response body, stopping once MAX_BYTES is reached
+
+        Args:
+            response: Streamed httpx response
+
+        Returns:
+            Body bytes, truncated to at most MAX_BYTES
+        """
+        buf = bytearray()
+        async for chunk in response.aiter_bytes(65536):
+            buf += chunk
+            if len(buf) >= MAX_BYTES:
+                logger.debug(f"Truncating {response.url} at {MAX_BYTES} bytes")
+                del buf[MAX_BYTES:]
+                break
+        return bytes(buf)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def get_site_specific_rules(domain):
         """
         Get site-specific CSS selectors and rules for each website
 
+        Results are cached per domain; callers must not mutate them.
+
         Args:
             domain: Website domain name
 
         Returns:
             Dictionary of selectors for that site
         """
-        rules = {
-            'sephora.com': {
-                'search_url': 'https://www.sephora.com/search?keyword=hair%20conditioner',
-                'product_links': '.css-ix8km1',
-                'product_name': '.css-1pgnl76',
-                'company': '.css-cjz2sh',
-                'ingredients_selector': '#ingredients',
-                'pagination': '.css-1kceze8'
-            },
-            'ulta.com': {
-                'search_url': 'https://www.ulta.com/hair-care-products/hair-treatments/conditioner?N=26yd',
-                'product_links': '.ProductCard__link',
-                'product_name': '.Text-ds--title-3',
-                'company': '.Text-ds--title-5',
-                'ingredients_selector': '#product-ingredients',
-                'pagination': '.Pagination__page-link'
-            },
-            'sallybeauty.com': {
-                'search_url': 'https://www.sallybeauty.com/hair-care/shop-by-product/conditioner/',
-                'product_links': '.product-tile-link',
-                'product_name': '.product-name',
-                'company': '.product-brand',
-                'ingredients_selector': '.product-ingredients',
-                'pagination': '.page-next'
-            },
-            'target.com': {
-                'search_url': 'https://www.target.com/c/conditioner-hair-care-beauty/-/N-5xu0i',
-                'product_links': 'a[data-test="product-title"]',
-                'product_name': 'h1[data-test="product-title"]',
-                'company': '[data-test="product-brand"]',
-                'ingredients_selector': '[data-test="ingredients-content"]',
-                'pagination': '.iUWCMa'
-            }
-        }
-
         # Get domain without www
-        domain = domain.replace('www.', '')
+        domain = domain.removeprefix('www.')
 
         # Return default rules if site not in our list
-        if domain not in rules:
+        if domain not in _SITE_RULES:
             return {
                 'search_url': f'https://{domain}/search?q=hair+conditioner',
                 'product_links': 'a',
@@ -165,9 +299,9 @@ class ConditionerScraper:
                 'pagination': None
             }
 
-        return rules[domain]
+        return _SITE_RULES[domain]
 
-    def get_product_urls(self, site_url, max_pages=3, max_products=3):
+    async def get_product_urls(self, site_url, max_pages=3, max_products=3):
         """
         Get product URLs from a retail site
 
@@ -179,7 +313,8 @@ class ConditionerScraper:
         Returns:
             List of product URLs
         """
-        domain = urlparse(site_url).netloc
+        domain = _netloc(site_url)
+        site_root = site_url[:site_url.find(domain) + len(domain)]
         rules = self.get_site_specific_rules(domain)
         search_url = rules['search_url']
         product_urls = []
@@ -196,53 +331,47 @@ class ConditionerScraper:
             try:
                 logger.info(f"Scanning page {current_page} of {domain}...")
 
-                # Add delay to be respectful
-                time.sleep(random.uniform(1.5, 3.5))  # Randomized delay to appear more human-like
-
                 # Get search results page with retry mechanism
-                response = self._make_request(search_url)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                html = await self._make_request(search_url)
+                tree = LexborHTMLParser(html)
 
                 # Extract product links
-                links = soup.select(rules['product_links'])
+                links = tree.css(rules['product_links'])
                 for link in links:
                     if len(product_urls) >= max_products:
                         break
 
-                    href = link.get('href')
+                    href = link.attributes.get('href')
                     if href:
                         # Make sure we have absolute URLs
-                        if not href.startswith('http'):
+                        if href.startswith('/') and not href.startswith('//'):
+                            href = site_root + href
+                        elif not href.startswith('http'):
                             href = urljoin(site_url, href)
                         product_urls.append(href)
 
                 # Try to find next page link
                 if rules['pagination']:
                     # Try different pagination strategies
-                    next_page = soup.select(rules['pagination'])
+                    next_page = tree.css(rules['pagination'])
                     if next_page:
-                        # Strategy 1: Last pagination element is next page
-                        next_href = next_page[-1].get('href')
-
-                        # Strategy 2: Look for elements with 'next' in text or class
-                        if not next_href:
-                            for page_link in next_page:
-                                if page_link.text.lower().strip() in ['next', '›', '>', '»'] or \
-                                   'next' in page_link.get('class', []) or \
-                                   'next' in page_link.get('id', ''):
-                                    next_href = page_link.get('href')
+                        # Single pass: an element marked 'next' by text, class or
+                        # id, or numbered one past the current page
+                        next_href = None
+                        for page_link in next_page:
+                            attrs = page_link.attributes
+                            text = page_link.text(strip=True).lower()
+                            if text in _NEXT_TOKENS or \
+                               'next' in (attrs.get('class') or '').split() or \
+                               'next' in (attrs.get('id') or '') or \
+                               (text.isdecimal() and int(text) == current_page + 1):
+                                next_href = attrs.get('href')
+                                if next_href:
                                     break
 
-                        # Strategy 3: Look for a page number higher than current
+                        # Fall back to treating the last pagination element as next page
                         if not next_href:
-                            for page_link in next_page:
-                                try:
-                                    page_num = int(page_link.text.strip())
-                                    if page_num == current_page + 1:
-                                        next_href = page_link.get('href')
-                                        break
-                                except (ValueError, TypeError):
-                                    continue
+                            next_href = next_page[-1].attributes.get('href')
 
                         if next_href:
                             search_url = urljoin(site_url, next_href)
@@ -264,7 +393,7 @@ class ConditionerScraper:
 
         return product_urls[:max_products]
 
-    def scrape_product(self, product_url):
+    async def scrape_product(self, product_url):
         """
         Scrape a single product page
 
@@ -274,69 +403,113 @@ class ConditionerScraper:
         Returns:
             Dictionary with product data
         """
+        logger.info(f"Scraping: {product_url}")
+
         # If in mock mode, return mock product data
         if self.mock_mode:
             # Extract a number from the URL to create varied mock data
-            mock_id = ''.join(filter(str.isdigit, product_url)) or '0'
-            mock_id = int(mock_id[-1:]) if mock_id else 0
-
-            mock_brands = ['Pantene', 'Herbal Essences', 'Dove', 'TRESemmé', 'L\'Oréal', 'Garnier', 'Head & Shoulders', 'Aussie']
-            mock_types = ['Moisturizing', 'Volumizing', 'Color Protection', 'Damage Repair', 'Curl Defining', 'Smoothing']
+            match = _LAST_DIGIT_RE.match(product_url)
+            mock_id = int(match.group(1)) if match else 0
 
             return {
-                'product_name': f"{mock_brands[mock_id % len(mock_brands)]} {mock_types[mock_id % len(mock_types)]} Conditioner",
-                'company': mock_brands[mock_id % len(mock_brands)],
+                'product_name': f"{_MOCK_BRANDS[mock_id % len(_MOCK_BRANDS)]} {_MOCK_TYPES[mock_id % len(_MOCK_TYPES)]} Conditioner",
+                'company': _MOCK_BRANDS[mock_id % len(_MOCK_BRANDS)],
                 'ingredients': "Water, Cetearyl Alcohol, Behentrimonium Chloride, Fragrance, Cetyl Esters, Isopropyl Alcohol, Methylparaben, Propylparaben",
                 'source_url': product_url,
-                'retailer': urlparse(product_url).netloc
+                'retailer': _netloc(product_url)
             }
 
         try:
-            domain = urlparse(product_url).netloc
-            rules = self.get_site_specific_rules(domain)
-
-            # Add delay to be respectful
-            time.sleep(random.uniform(1.5, 3.5))  # Randomized delay
+            domain = _netloc(product_url)
 
             # Get product page with retry mechanism
-            response = self._make_request(product_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract product name
-            product_name = None
-            name_element = soup.select_one(rules['product_name'])
-            if name_element:
-                product_name = name_element.text.strip()
-
-            # Extract company name
-            company = None
-            if rules['company']:
-                company_element = soup.select_one(rules['company'])
-                if company_element:
-                    company = company_element.text.strip()
-
-            # Extract ingredients
-            ingredients = None
-            if rules['ingredients_selector']:
-                ingredients_section = soup.select_one(rules['ingredients_selector'])
-                if ingredients_section:
-                    ingredients = ingredients_section.text.strip()
-                    # Clean up the ingredients text
-                    ingredients = re.sub(r'\s+', ' ', ingredients)
-                    ingredients = ingredients.replace('Ingredients:', '').replace('INGREDIENTS:', '').strip()
+            html = await self._make_request(product_url)
 
-            return {
-                'product_name': product_name,
-                'company': company,
-                'ingredients': ingredients,
-                'source_url': product_url,
-                'retailer': domain
-            }
+            # Parse off the event loop so fetching continues meanwhile
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, _parse_product, product_url, html, domain)
 
         except Exception as e:
             logger.error(f"Error scraping {product_url}: {str(e)}")
             return None
 
+    async def _process_site(self, site, max_products_per_site):
+        """
+        Discover and scrape all products for a single retail site
+
+        Args:
+            site: Base URL of the retail site
+            max_products_per_site: Maximum number of products to scrape
+        """
+        logger.info(f"\nProcessing {site}...")
+
+        # Get product URLs
+        product_urls = await self.get_product_urls(site, max_products=max_products_per_site)
+        logger.info(f"Found {len(product_urls)} product URLs")
+
+        # Scrape all products concurrently, recording each as it completes
+        for future in asyncio.as_completed([self.scrape_product(url) for url in product_urls]):
+            product_data = await future
+            if product_data:
+                self._record(product_data)
+
+    def _record(self, product_data):
+        """
+        Store a scraped product and write it to the CSV output if one is open
+
+        Args:
+            product_data: Dictionary with product data
+        """
+        self.results.append(product_data)
+        if self._writer:
+            self._writer.writerow(product_data)
+            # Flush so partial output survives a crash
+            self._csv_file.flush()
+
+    async def run_async(self, max_products_per_site=5, output=None):
+        """
+        Run the scraper on all configured retail sites concurrently
+
+        Must be called inside 'async with ConditionerScraper(...)'.
+
+        Args:
+            max_products_per_site: Maximum number of products to scrape per site
+            output: Optional CSV filename; rows are written as products complete
+
+        Returns:
+            List of product data dictionaries
+        """
+        if self._client is None:
+            raise RuntimeError("run_async() must be called inside 'async with ConditionerScraper(...)'")
+
+        self.results = []
+        if output is None:
+            await self._process_all_sites(max_products_per_site)
+            return self.results
+
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            self._csv_file = f
+            self._writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            self._writer.writeheader()
+            try:
+                await self._process_all_sites(max_products_per_site)
+            finally:
+                self._csv_file = None
+                self._writer = None
+        return self.results
+
+    async def _process_all_sites(self, max_products_per_site):
+        """
+        Process every configured retail site concurrently
+
+        Args:
+            max_products_per_site: Maximum number of products to scrape per site
+        """
+        await asyncio.gather(*[
+            self._process_site(site, max_products_per_site)
+            for site in self.retail_sites
+        ])
+
     def run(self, max_products_per_site=5):
         """
         Run the scraper on all configured retail sites
@@ -347,26 +520,14 @@ class ConditionerScraper:
         Returns:
             DataFrame with all product data
         """
-        all_products = []
-
-        for site in self.retail_sites:
-            logger.info(f"\nProcessing {site}...")
+        # Only this DataFrame-returning wrapper needs pandas
+        import pandas as pd
 
-            # Get product URLs
-            product_urls = self.get_product_urls(site, max_products=max_products_per_site)
-            logger.info(f"Found {len(product_urls)} product URLs")
+        async def _run():
+            async with self:
+                return await self.run_async(max_products_per_site)
 
-            # Scrape each product
-            for url in product_urls:
-                logger.info(f"Scraping: {url}")
-                product_data = self.scrape_product(url)
-                if product_data:
-                    all_products.append(product_data)
-
-        # Create DataFrame and update self.results
-        df = pd.DataFrame(all_products)
-        self.results = all_products
-        return df
+        return pd.DataFrame(asyncio.run(_run()))
 
     def save_to_csv(self, filename='hair_conditioners_data.csv', df=None):
         """
@@ -376,13 +537,66 @@ class ConditionerScraper:
             filename: Name of the CSV file to save
             df: Optional DataFrame to save. If None, uses self.results
         """
-        if df is None:
-            df = pd.DataFrame(self.results)
-
-        df.to_csv(filename, index=False)
+        if df is not None:
+            # Let pandas write the frame so missing values stay empty cells
+            df.to_csv(filename, index=False)
+        else:
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(self.results)
         logger.info(f"Data saved to {filename}")
 
 
+def _parse_product(product_url, html, domain):
+    """
+    Extract product data from a fetched product page
+
+    Kept at module level with plain arguments so it can run in a worker
+    process.
+
+    Args:
+        product_url: URL of the product page
+        html: Raw page body
+        domain: Retailer domain used to look up site rules
+
+    Returns:
+        Dictionary with product data
+    """
+    rules = ConditionerScraper.get_site_specific_rules(domain)
+    tree = LexborHTMLParser(html)
+
+    # Extract product name
+    product_name = None
+    name_element = tree.css_first(rules['product_name'])
+    if name_element:
+        product_name = name_element.text().strip()
+
+    # Extract company name
+    company = None
+    if rules['company']:
+        company_element = tree.css_first(rules['company'])
+        if company_element:
+            company = company_element.text().strip()
+
+    # Extract ingredients
+    ingredients = None
+    if rules['ingredients_selector']:
+        ingredients_section = tree.css_first(rules['ingredients_selector'])
+        if ingredients_section:
+            ingredients = ingredients_section.text().strip()
+            # Clean up the ingredients text
+            ingredients = _INGR_PREFIX_RE.sub('', _WS_RE.sub(' ', ingredients)).strip()
+
+    return {
+        'product_name': product_name,
+        'company': company,
+        'ingredients': ingredients,
+        'source_url': product_url,
+        'retailer': domain
+    }
+
+
 def main():
     import argparse
 
@@ -406,12 +620,21 @@ def main():
         logger.info("Starting conditioner scraper...")
         logger.info(f"Mock mode: {'Enabled' if args.mock else 'Disabled'}")
 
-        scraper = ConditionerScraper(retail_sites, mock_mode=args.mock)
-        df = scraper.run(max_products_per_site=args.max_products)
+        async def _scrape():
+            async with ConditionerScraper(retail_sites, mock_mode=args.mock) as scraper:
+                # Results are streamed to the CSV as each product completes
+                await scraper.run_async(max_products_per_site=args.max_products, output=args.output)
+            return scraper
+
+        # Use uvloop's faster event loop when it is installed, without
+        # changing the process-wide event loop policy
+        try:
+            from uvloop import run as run_loop
+        except ImportError:
+            run_loop = asyncio.run
 
-        # Save results using the class method
-        scraper.save_to_csv(args.output, df)
-        logger.info(f"\nScraping complete! Collected data for {len(df)} products")
+        scraper = run_loop(_scrape())
+        logger.info(f"\nScraping complete! Collected data for {len(scraper.results)} products")
         logger.info(f"Data saved to {args.output}")
     except KeyboardInterrupt:
         logger.info("Scraping interrupted by user")
@@ -0,0 +1,88 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+TUTORIAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tutorial')
+sys.path.insert(0, TUTORIAL_DIR)
+
+from tutorial.parse_products import parse_product
+
+
+class TestParseProducts(unittest.TestCase):
+    """Test cases for the raw product parser."""
+
+    def test_blank_records_fall_back_to_meta_title(self):
+        """Blank or comment-only pages still produce a record."""
+        for raw_html in ['', '  \n', '<!-- placeholder -->']:
+            with self.subTest(raw_html=raw_html):
+                product = parse_product({
+                    'url': 'https://www.bumbleandbumble.com/product/1/2/care/shampoos/shampoo',
+                    'raw_html': raw_html,
+                    'meta_title': 'Shampoo | Bumble and bumble',
+                    'category': 'Shampoos',
+                })
+                self.assertEqual(product['name'], 'Shampoo')
+                self.assertEqual(product['options'], [])
+                self.assertEqual(product['ingredients'], '')
+                self.assertEqual(product['other'], 'CATEGORY\nShampoos')
+
+    def _parse_html(self, raw_html):
+        """Parse a page with no metadata to fall back on."""
+        return parse_product({
+            'url': 'https://www.bumbleandbumble.com/product/1/2/care/shampoos/shampoo',
+            'raw_html': raw_html,
+            'meta_title': '',
+            'category': '',
+        })
+
+    def test_ingredients_heading_outside_product_container(self):
+        """An INGREDIENTS heading anywhere on the page is used."""
+        product = self._parse_html(
+            '<html><body><div class="product-full"><h1 class="product-full__name">Shampoo</h1></div>'
+            '<section><h3>INGREDIENTS</h3><p>Water\\Aqua\\Eau, Glycerin</p></section></body></html>')
+        self.assertEqual(product['ingredients'], 'Water\\Aqua\\Eau, Glycerin')
+
+    def test_select_options_outside_product_container(self):
+        """Size options in a select outside the product container are used."""
+        product = self._parse_html(
+            '<html><body><div class="product-full"><span class="product-full__price">$32.00</span></div>'
+            '<form><select><option>Select a size</option><option>250ml</option></select></form></body></html>')
+        self.assertEqual(product['options'], [{'size': '250ml', 'price': '$32.00'}])
+
+    def test_price_fallback_scans_whole_page(self):
+        """The price fallback finds a price outside the product container."""
+        product = self._parse_html(
+            '<html><body><div class="product-full"><h1 class="product-full__name">Shampoo</h1></div>'
+            '<footer>Now only $18.50</footer></body></html>')
+        self.assertEqual(product['options'], [{'size': 'Standard', 'price': '$18.50'}])
+
+    def test_cli_parses_file_with_blank_record(self):
+        """A blank record in the input does not abort the whole run."""
+        records = [{
+            'url': f'https://www.bumbleandbumble.com/product/1/{i}/care/shampoos/shampoo-{i}',
+            'raw_html': '  \n' if i == 3 else f'<html><body><h1 class="product-full__name">Shampoo {i}</h1></body></html>',
+            'meta_title': f'Shampoo {i} | Bumble and bumble',
+            'category': 'Shampoos',
+        } for i in range(6)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = os.path.join(tmp, 'raw.jsonl')
+            output_file = os.path.join(tmp, 'parsed.json')
+            with open(input_file, 'w') as f:
+                for record in records:
+                    f.write(json.dumps(record) + '\n')
+
+            subprocess.run([sys.executable, '-m', 'tutorial.parse_products', input_file, output_file],
+                           cwd=TUTORIAL_DIR, check=True, capture_output=True)
+
+            with open(output_file) as f:
+                products = json.load(f)
+
+        self.assertEqual([p['name'] for p in products], [f'Shampoo {i}' for i in range(6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,55 @@
 import unittest
-import json
-import requests
+import asyncio
+import aiohttp
+import orjson
 from urllib.parse import urlparse
 import os
 
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+async def _check_url(session, url, timeout):
+    """Return the status code for a URL, falling back to GET if HEAD fails."""
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with session.head(url, headers=HEADERS, allow_redirects=True, timeout=client_timeout) as response:
+        if response.status < 400:
+            return response.status
+    async with session.get(url, headers=HEADERS, allow_redirects=True, timeout=client_timeout) as response:
+        return response.status
+
+
+async def _check_urls(urls, timeout):
+    """Check all URLs concurrently over one session.
+
+    Returns a list of status codes (or exceptions) in the same order as urls.
+    """
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=50)) as session:
+        return await asyncio.gather(*[_check_url(session, url, timeout) for url in urls],
+                                    return_exceptions=True)
+
+
 class TestSourcesJson(unittest.TestCase):
     """Test cases for validating the sources.json file."""
 
-    def setUp(self):
-        """Load the sources.json file before each test."""
+    @classmethod
+    def setUpClass(cls):
+        """Load the sources.json file once for all tests."""
         # Use the correct path to sources.json
         file_path = os.path.join('tutorial', 'sources.json')
-        with open(file_path, 'r') as f:
-            self.sources = json.load(f)
+        with open(file_path, 'rb') as f:
+            cls.sources = orjson.loads(f.read())
+
+        # Index sources by lower-cased brand for direct lookups. Malformed
+        # entries are skipped here so the schema tests can report them
+        cls.sources_by_brand = {}
+        if isinstance(cls.sources, list):
+            cls.sources_by_brand = {
+                source['brand'].lower(): source
+                for source in cls.sources
+                if isinstance(source, dict) and isinstance(source.get('brand'), str)
+            }
 
     def test_sources_is_list(self):
         """Test that sources.json contains a list."""
@@ -51,28 +88,21 @@ class TestSourcesJson(unittest.TestCase):
         self.skipTest("Skipping URL reachability test to avoid making HTTP requests")
 
         timeout = 5  # seconds
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
 
-        for source in self.sources:
+        # Check all URLs concurrently, then assert on each result
+        statuses = asyncio.run(_check_urls([source['url'] for source in self.sources], timeout))
+
+        for source, status_code in zip(self.sources, statuses):
             url = source['url']
             brand = source['brand']
 
-            try:
-                response = requests.head(url, timeout=timeout, headers=headers, allow_redirects=True)
+            if isinstance(status_code, Exception):
+                self.fail(f"Failed to connect to {url} for {brand}: {status_code!r}")
 
-                # If HEAD request fails, try GET
-                if response.status_code >= 400:
-                    response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
-
-                status_code = response.status_code
-                self.assertTrue(
-                    200 <= status_code < 300,
-                    f"URL for {brand} returned status code {status_code}: {url}"
-                )
-            except requests.RequestException as e:
-                self.fail(f"Failed to connect to {url} for {brand}: {str(e)}")
+            self.assertTrue(
+                200 <= status_code < 300,
+                f"URL for {brand} returned status code {status_code}: {url}"
+            )
 
     def test_bumble_and_bumble_url(self):
         """Test specifically for the Bumble and bumble URL.
@@ -80,11 +110,7 @@ class TestSourcesJson(unittest.TestCase):
         This test checks if the Bumble and bumble URL is valid and properly formatted.
         """
         # Find the Bumble and bumble entry
-        bumble_entry = None
-        for source in self.sources:
-            if source['brand'].lower() == 'bumble and bumble':
-                bumble_entry = source
-                break
+        bumble_entry = self.sources_by_brand.get('bumble and bumble')
 
         # Verify that Bumble and bumble exists in the sources
         self.assertIsNotNone(bumble_entry, "Bumble and bumble entry not found in sources.json")
@@ -114,34 +140,21 @@ class TestSourcesJson(unittest.TestCase):
         This test makes an actual HTTP request to verify the URL is accessible.
         """
         # Find the Bumble and bumble entry
-        bumble_entry = None
-        for source in self.sources:
-            if source['brand'].lower() == 'bumble and bumble':
-                bumble_entry = source
-                break
+        bumble_entry = self.sources_by_brand.get('bumble and bumble')
 
         self.assertIsNotNone(bumble_entry, "Bumble and bumble entry not found in sources.json")
 
         url = bumble_entry['url']
         timeout = 10  # seconds
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
 
-        try:
-            response = requests.head(url, timeout=timeout, headers=headers, allow_redirects=True)
+        status_code = asyncio.run(_check_urls([url], timeout))[0]
+        if isinstance(status_code, Exception):
+            self.fail(f"Failed to connect to Bumble and bumble URL {url}: {status_code!r}")
 
-            # If HEAD request fails, try GET
-            if response.status_code >= 400:
-                response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
-
-            status_code = response.status_code
-            self.assertTrue(
-                200 <= status_code < 300,
-                f"Bumble and bumble URL returned status code {status_code}: {url}"
-            )
-        except requests.RequestException as e:
-            self.fail(f"Failed to connect to Bumble and bumble URL {url}: {str(e)}")
+        self.assertTrue(
+            200 <= status_code < 300,
+            f"Bumble and bumble URL returned status code {status_code}: {url}"
+        )
 
     def test_virtue_url(self):
         """Test specifically for the Virtue URL.
@@ -149,11 +162,7 @@ class TestSourcesJson(unittest.TestCase):
         This test checks if the Virtue URL is valid and reachable.
         """
         # Find the Virtue entry
-        virtue_entry = None
-        for source in self.sources:
-            if source['brand'].lower() == 'virtue':
-                virtue_entry = source
-                break
+        virtue_entry = self.sources_by_brand.get('virtue')
 
         self.assertIsNotNone(virtue_entry, "Virtue entry not found in sources.json")
 
@@ -163,24 +172,15 @@ class TestSourcesJson(unittest.TestCase):
 
         # Check if the URL is reachable
         timeout = 10  # seconds
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        try:
-            response = requests.head(url, timeout=timeout, headers=headers, allow_redirects=True)
 
-            # If HEAD request fails, try GET
-            if response.status_code >= 400:
-                response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+        status_code = asyncio.run(_check_urls([url], timeout))[0]
+        if isinstance(status_code, Exception):
+            self.fail(f"Failed to connect to Virtue URL {url}: {status_code!r}")
 
-            status_code = response.status_code
-            self.assertTrue(
-                200 <= status_code < 300,
-                f"Virtue URL returned status code {status_code}: {url}"
-            )
-        except requests.RequestException as e:
-            self.fail(f"Failed to connect to Virtue URL {url}: {str(e)}")
+        self.assertTrue(
+            200 <= status_code < 300,
+            f"Virtue URL returned status code {status_code}: {url}"
+        )
 
 if __name__ == '__main__':
     unittest.main()
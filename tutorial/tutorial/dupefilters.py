@@ -0,0 +1,32 @@
+# Duplicate request filtering for the tutorial spiders
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/settings.html#dupefilter-class
+
+from urllib.parse import urlsplit, urlunsplit
+
+from scrapy.dupefilters import RFPDupeFilter
+
+
+def canonical_product_url(url):
+    """Reduce a product page URL to its canonical form; other URLs are returned unchanged."""
+    parts = urlsplit(url)
+    if not parts.path.startswith('/product/'):
+        return url
+    # Product pages declare the bare path as canonical, so query strings,
+    # fragments and trailing slashes all point at the same page
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+
+class ProductDupeFilter(RFPDupeFilter):
+    """Drop requests for product pages that were already scheduled under another URL.
+
+    Deduplicating on the canonical product URL here, before the request is
+    scheduled, saves downloading a page only to discard it in the spider.
+    """
+
+    def request_seen(self, request):
+        canonical = canonical_product_url(request.url)
+        if canonical != request.url:
+            request = request.replace(url=canonical)
+        return super().request_seen(request)
@@ -1,27 +1,81 @@
 import json
+import os
 import re
 from pathlib import Path
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# orjson is much faster for large batches; fall back to the stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Precompiled patterns used for every product
+_WS_RE = re.compile(r'\s+')
+_BRAND_SUFFIX_RE = re.compile(r'\s*\|\s*Bumble and bumble\.?$')
+_PRICE_RE = re.compile(r'\$\d+\.\d{2}')
+# Ingredient lists typically start with Water\Aqua\Eau
+_INGREDIENTS_RE = re.compile(r'(?:[Ii]ngredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)')
+# Literal every _INGREDIENTS_RE match contains; a substring test is far cheaper than the regex scan
+_INGREDIENTS_MARKER = 'Water\\Aqua\\Eau'
+_CHEMICAL_RE = re.compile(r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+')
+
+# Raw HTML is stored as text, so parse it as UTF-8 regardless of any meta charset
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+def _has_class(tag, cls):
+    """Build an XPath step matching `tag` elements carrying the class `cls`."""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+# Precompiled XPath queries, evaluated directly by lxml in C
+# normalize-space() strips and collapses whitespace inside libxml2; '' when there is no match
+_NAME_XP = etree.XPath(f"normalize-space({_has_class('h1', 'product-full__name')})")
+_SIZE_ITEMS_XP = etree.XPath(_has_class('li', 'product-full__size-selector-item'))
+_PRICE_XP = etree.XPath(f"{_has_class('span', 'product-full__price')} | {_has_class('div', 'product-full__price')}")
+_SELECT_OPTIONS_XP = etree.XPath('//select//option')
+_INGREDIENTS_HEADING_XP = etree.XPath('//h4[contains(., "INGREDIENTS")] | //h3[contains(., "INGREDIENTS")]')
+_NEXT_ELEMENT_XP = etree.XPath('(descendant::* | following::*)[1]')
+_DESCRIPTION_XP = etree.XPath(_has_class('div', 'product-full__description'))
+_DETAIL_CONTENT_XP = etree.XPath(_has_class('div', 'product-full__detail-content'))
+# Visible text only; script and style contents are not page text
+_TEXT_XP = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+def get_text(element):
+    """Concatenate the visible text under an element."""
+    return ''.join(_TEXT_XP(element))
+
+def first(xpath, tree):
+    """Return the first match of a compiled XPath query, or None."""
+    matches = xpath(tree)
+    return matches[0] if matches else None
+
+def parse_html(raw_html):
+    """Parse raw HTML into an lxml tree; blank or comment-only pages give an empty document."""
+    try:
+        return lxml.html.document_fromstring(raw_html.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return lxml.html.document_fromstring(b'<html></html>', parser=_HTML_PARSER)
 
 def clean_text(text):
     """Clean up text by removing extra whitespace."""
     if not text:
         return ""
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text).strip()
 
-def extract_name(soup, meta_title):
+def extract_name(tree, meta_title):
     """Extract product name from the page."""
-    # Try to get name from h1 tag
-    name = soup.select_one('h1.product-full__name')
-    if name:
-        name = name.get_text().strip()
+    # Try to get name from h1 tag; strip() also drops non-breaking spaces XPath keeps
+    name = _NAME_XP(tree).strip()
     
     # If not found or is "Sign in", try meta title
     if not name or name == "Sign in":
         if meta_title:
             # Remove website name if present
-            name = re.sub(r'\s*\|\s*Bumble and bumble\.?$', '', meta_title)
+            name = _BRAND_SUFFIX_RE.sub('', meta_title)
     
     # If still not found, try to extract from URL
     if not name:
@@ -30,27 +84,28 @@ def extract_name(soup, meta_title):
     
     return clean_text(name)
 
-def extract_options(soup):
+def extract_options(tree):
     """Extract product options (size and price)."""
     options = []
     
+    # The price element is shared by every option on the page, so look it up once
+    price_elem = first(_PRICE_XP, tree)
+    price_text = get_text(price_elem).strip() if price_elem is not None else None
+    
     # Try to find size selector items
-    option_blocks = soup.select('li.product-full__size-selector-item')
+    option_blocks = _SIZE_ITEMS_XP(tree)
     for block in option_blocks:
-        size = block.get_text().strip()
-        price_elem = soup.select_one('span.product-full__price, div.product-full__price')
-        if size and price_elem:
+        size = get_text(block).strip()
+        if size and price_text is not None:
             options.append({
                 "size": size,
-                "price": price_elem.get_text().strip()
+                "price": price_text
             })
     
     # If no options found, try alternative selectors
     if not options:
-        sizes = [opt.get_text().strip() for opt in soup.select('select option')]
-        price = soup.select_one('span.product-full__price, div.product-full__price')
-        if sizes and price:
-            price_text = price.get_text().strip()
+        sizes = [get_text(opt).strip() for opt in _SELECT_OPTIONS_XP(tree)]
+        if sizes and price_text is not None:
             for size in sizes:
                 if size and not size.startswith('Select'):
                     options.append({
@@ -60,8 +115,7 @@ def extract_options(soup):
     
     # If still no options, try to find a price anywhere
     if not options:
-        price_pattern = r'\$\d+\.\d{2}'
-        price_matches = re.findall(price_pattern, soup.get_text())
+        price_matches = _PRICE_RE.findall(get_text(tree))
         if price_matches:
             options.append({
                 "size": "Standard",
@@ -70,34 +124,36 @@ def extract_options(soup):
     
     return options
 
-def extract_ingredients(soup):
+def extract_ingredients(tree, details):
     """Extract ingredients from the page."""
     ingredients = []
     
     # Method 1: Look for ingredients section
-    ingredient_section = soup.select_one('h4:-soup-contains("INGREDIENTS"), h3:-soup-contains("INGREDIENTS")')
-    if ingredient_section and ingredient_section.find_next():
-        ingredients_text = ingredient_section.find_next().get_text().strip()
-        if ingredients_text:
-            ingredients.append(ingredients_text)
+    ingredient_section = first(_INGREDIENTS_HEADING_XP, tree)
+    if ingredient_section is not None:
+        next_element = first(_NEXT_ELEMENT_XP, ingredient_section)
+        if next_element is not None:
+            ingredients_text = get_text(next_element).strip()
+            if ingredients_text:
+                ingredients.append(ingredients_text)
     
     # Method 2: Look for ingredient list pattern in product details
     if not ingredients:
-        details_text = ' '.join([d.get_text() for d in soup.select('div.product-full__detail-content')])
+        details_text = ' '.join(get_text(d) for d in details)
         if details_text:
             # Look for ingredient list that typically starts with Water\Aqua\Eau
-            ingredients_match = re.search(r'(?:Ingredients:|ingredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)', details_text)
+            ingredients_match = _INGREDIENTS_MARKER in details_text and _INGREDIENTS_RE.search(details_text)
             if ingredients_match:
                 ingredients.append(ingredients_match.group(1).strip())
             else:
                 # Try to find a list of chemical ingredients
-                ingredients_match = re.search(r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+', details_text)
+                ingredients_match = _CHEMICAL_RE.search(details_text)
                 if ingredients_match:
                     ingredients.append(ingredients_match.group(0).strip())
     
     return ', '.join(ingredients)
 
-def extract_other_info(soup, category):
+def extract_other_info(tree, category, details):
     """Extract other product information."""
     other_info = []
     
@@ -106,24 +162,22 @@ def extract_other_info(soup, category):
         other_info.append(f"CATEGORY\n{category}")
     
     # Try to extract product description
-    description = soup.select_one('div.product-full__description')
-    if description:
-        description_text = description.get_text().strip()
+    description = first(_DESCRIPTION_XP, tree)
+    if description is not None:
+        description_text = get_text(description).strip()
         if description_text:
             other_info.append(f"DESCRIPTION\n{description_text}")
     
-    # Extract product details
-    details = soup.select_one('div.product-full__detail-content')
+    # Extract product details from the first detail block
     if details:
-        details_text = details.get_text().strip()
+        details_text = get_text(details[0]).strip()
         
         # Remove ingredient list if present
-        ingredients_pattern = r'(?:Ingredients:|ingredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)'
-        details_text = re.sub(ingredients_pattern, '', details_text)
+        if _INGREDIENTS_MARKER in details_text:
+            details_text = _INGREDIENTS_RE.sub('', details_text)
         
         # Remove chemical ingredient lists
-        chemical_pattern = r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+'
-        details_text = re.sub(chemical_pattern, '', details_text)
+        details_text = _CHEMICAL_RE.sub('', details_text)
         
         # Clean up the text
         details_text = clean_text(details_text)
@@ -140,14 +194,17 @@ def parse_product(product_data):
     meta_title = product_data.get('meta_title', '')
     category = product_data.get('category', '')
     
-    # Parse HTML with BeautifulSoup
-    soup = BeautifulSoup(raw_html, 'html.parser')
+    # Parse HTML once with lxml; all extraction below runs as XPath on this tree
+    tree = parse_html(raw_html)
+    
+    # Detail blocks feed both the ingredients fallback and the DETAILS section
+    details = _DETAIL_CONTENT_XP(tree)
     
     # Extract product information
-    name = extract_name(soup, meta_title)
-    options = extract_options(soup)
-    ingredients = extract_ingredients(soup)
-    other = extract_other_info(soup, category)
+    name = extract_name(tree, meta_title)
+    options = extract_options(tree)
+    ingredients = extract_ingredients(tree, details)
+    other = extract_other_info(tree, category, details)
     
     # Return parsed product data
     return {
@@ -158,29 +215,80 @@ def parse_product(product_data):
         'other': other
     }
 
+def iter_raw(path):
+    """Yield raw product records one at a time from a JSONL file."""
+    loads = orjson.loads if orjson else json.loads
+    with open(path, 'rb') as f:
+        for line in f:
+            yield loads(line)
+
+def parse_all(executor, raw_products, window):
+    """Parse raw products in the executor, yielding results in input order.
+
+    At most `window` products are in flight at once, so only that many raw
+    HTML blobs are held in memory. Executor.map would submit every input
+    up front.
+    """
+    pending = deque()
+    for raw_product in raw_products:
+        pending.append(executor.submit(parse_product, raw_product))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def write_json(path, products):
+    """Write all parsed products to a single indented JSON array."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(products, f, indent=2)
+
+def write_jsonl(path, products):
+    """Stream parsed products to a JSON Lines file as they arrive.
+
+    Returns the number of products written.
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        for product in products:
+            if orjson:
+                f.write(orjson.dumps(product) + b'\n')
+            else:
+                f.write(json.dumps(product).encode('utf-8') + b'\n')
+            count += 1
+    return count
+
 def main():
     parser = argparse.ArgumentParser(description='Parse raw product data from Bumble and Bumble website')
     parser.add_argument('input_file', help='Path to the raw product data file (JSONL format)')
-    parser.add_argument('output_file', help='Path to save the parsed product data (JSON format)')
+    parser.add_argument('output_file', help='Path to save the parsed product data')
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument('--json', dest='jsonl', action='store_false',
+                               help='Write a single JSON array (default)')
+    output_format.add_argument('--jsonl', dest='jsonl', action='store_true',
+                               help='Stream one JSON object per line as products are parsed (lower memory)')
+    parser.set_defaults(jsonl=False)
     args = parser.parse_args()
     
-    # Read raw product data
-    raw_products = []
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            raw_products.append(json.loads(line))
-    
-    # Parse each product
-    parsed_products = []
-    for raw_product in raw_products:
-        parsed_product = parse_product(raw_product)
-        parsed_products.append(parsed_product)
-    
-    # Save parsed product data
-    with open(args.output_file, 'w', encoding='utf-8') as f:
-        json.dump(parsed_products, f, indent=2)
+    # Stream raw products through a process pool; each parse is independent
+    # and CPU-bound. A few products per worker in flight keeps every worker
+    # busy without reading the whole input into memory
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parsed_products = parse_all(executor, iter_raw(args.input_file), window=workers * 4)
+        
+        # Save parsed product data
+        if args.jsonl:
+            count = write_jsonl(args.output_file, parsed_products)
+        else:
+            parsed_products = list(parsed_products)
+            write_json(args.output_file, parsed_products)
+            count = len(parsed_products)
     
-    print(f"Parsed {len(parsed_products)} products and saved to {args.output_file}")
+    print(f"Parsed {count} products and saved to {args.output_file}")
 
 if __name__ == "__main__":
     main()
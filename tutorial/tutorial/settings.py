@@ -21,6 +21,9 @@ ADDONS = {}
 # Obey robots.txt rules
 ROBOTSTXT_OBEY = True
 
+# Filter duplicate product pages by canonical URL before they are downloaded
+DUPEFILTER_CLASS = "tutorial.dupefilters.ProductDupeFilter"
+
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
 #CONCURRENT_REQUESTS = 32
 
@@ -2,6 +2,16 @@ import scrapy
 import re
 from tutorial.items import ProductItem
 
+# Precompiled patterns used for every product
+_WS_RE = re.compile(r'\s+')
+_BRAND_SUFFIX_RE = re.compile(r'\s*\|\s*Bumble and bumble\.?$')
+_PRICE_RE = re.compile(r'\$\d+\.\d{2}')
+# Ingredient lists typically start with Water\Aqua\Eau
+_INGREDIENTS_RE = re.compile(r'(?:[Ii]ngredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)')
+# Literal every _INGREDIENTS_RE match contains; a substring test is far cheaper than the regex scan
+_INGREDIENTS_MARKER = 'Water\\Aqua\\Eau'
+_CHEMICAL_RE = re.compile(r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+')
+
 class ProductsAllSpider(scrapy.Spider):
     name = "products_all"
     allowed_domains = ["bumbleandbumble.com"]
@@ -14,38 +24,49 @@ class ProductsAllSpider(scrapy.Spider):
         # Optionally throttle for good etiquette
         'DOWNLOAD_DELAY': 1
     }
+    # XPath equivalents of the page selectors, written out once at class scope so
+    # Parsel does not translate CSS to XPath on every response
+    _PRODUCT_LINK_XP = '//a[starts-with(@href, "/product/")]'
+    _NEXT_PAGE_XP = ('//a[contains(concat(" ", normalize-space(@class), " "), " pagination__next ")]/@href'
+                     ' | //a[@rel="next"]/@href')
+    _CATEGORY_LINK_XP = ('//a[starts-with(@href, "/shop-by-concern/")]/@href'
+                         ' | //a[starts-with(@href, "/collections/")]/@href')
+    _OG_TITLE_XP = '//meta[@property="og:title"]/@content'
+    _NAME_XP = ('//h1[contains(concat(" ", normalize-space(@class), " "), " product-full__name ")]/text()'
+                ' | //h3/text()')
+    _SIZE_ITEM_XP = '//li[contains(concat(" ", normalize-space(@class), " "), " product-full__size-selector-item ")]'
+    _PRICE_XP = ('//span[contains(concat(" ", normalize-space(@class), " "), " product-full__price ")]/text()'
+                 ' | //div[contains(concat(" ", normalize-space(@class), " "), " product-full__price ")]/text()')
+    _SELECT_OPTION_XP = '//select//option/text()'
+    _DETAIL_CONTENT_XP = '//div[contains(concat(" ", normalize-space(@class), " "), " product-full__detail-content ")]/text()'
+    _DESCRIPTION_XP = '//div[contains(concat(" ", normalize-space(@class), " "), " product-full__description ")]/text()'
 
     def parse(self, response):
-        # Find product links on category/listing pages
-        product_links = response.css('a[href^="/product/"]::attr(href)').getall()
-        for link in product_links:
-            url = response.urljoin(link.split('#')[0])  # Remove fragment
+        # Find product links on category/listing pages; the same product is
+        # often linked several times per page, so only request each URL once
+        page_urls = set()
+        for link in response.xpath(self._PRODUCT_LINK_XP):
+            url = response.urljoin(link.attrib.get('href').split('#')[0])  # Remove fragment
+            if url in page_urls:
+                continue
+            page_urls.add(url)
             yield scrapy.Request(url, callback=self.parse_product)
 
         # Pagination (if exists)
-        next_page = response.css('a.pagination__next::attr(href), a[rel="next"]::attr(href)').get()
+        next_page = response.xpath(self._NEXT_PAGE_XP).get()
         if next_page:
             yield response.follow(next_page, self.parse)
 
         # Discover category/collection pages from nav/menu if needed (optional)
-        category_links = response.css('a[href^="/shop-by-concern/"]::attr(href), a[href^="/collections/"]::attr(href)').getall()
+        category_links = response.xpath(self._CATEGORY_LINK_XP).getall()
         for link in category_links:
             yield response.follow(link, self.parse)
 
     def parse_product(self, response):
-        # Deduplicate using canonical URL
-        canonical = response.css('link[rel="canonical"]::attr(href)').get()
-        if hasattr(self, 'seen'):
-            if canonical in self.seen:
-                return
-            self.seen.add(canonical)
-        else:
-            self.seen = {canonical}
-
         # Extract product name from URL if not available on page
-        name = response.css('h1.product-full__name::text, h3::text').get()
+        name = response.xpath(self._NAME_XP).get()
         if not name or name == "Sign in":
-            name = response.css('meta[property="og:title"]::attr(content)').get()
+            name = response.xpath(self._OG_TITLE_XP).get()
             if not name:
                 # Extract product name from URL path
                 url_path = response.url.split('/')
@@ -57,26 +78,28 @@ class ProductsAllSpider(scrapy.Spider):
         # Clean up the product name
         if name:
             # Remove website name if present
-            name = re.sub(r'\s*\|\s*Bumble and bumble\.?$', '', name)
+            name = _BRAND_SUFFIX_RE.sub('', name)
             # Clean up any extra whitespace
-            name = re.sub(r'\s+', ' ', name).strip()
+            name = _WS_RE.sub(' ', name).strip()
+
+        # Selector results reused below; each is evaluated once per page
+        price = response.xpath(self._PRICE_XP).get()
+        detail_texts = response.xpath(self._DETAIL_CONTENT_XP).getall()
 
         # Extract product options (size and price)
         options = []
-        option_blocks = response.css('li.product-full__size-selector-item')
+        option_blocks = response.xpath(self._SIZE_ITEM_XP)
         for block in option_blocks:
-            size = block.css('::text').get()
-            price_elem = response.css('span.product-full__price::text, div.product-full__price::text').get()
-            if size and price_elem:
+            size = block.xpath('.//text()').get()
+            if size and price:
                 options.append({
                     "size": size.strip(),
-                    "price": price_elem.strip()
+                    "price": price.strip()
                 })
 
         # If no options found, try alternative selectors
         if not options:
-            sizes = response.css('select option::text').getall()
-            price = response.css('span.product-full__price::text, div.product-full__price::text').get()
+            sizes = response.xpath(self._SELECT_OPTION_XP).getall()
             if sizes and price:
                 for size in sizes:
                     if size.strip() and not size.strip().startswith('Select'):
@@ -87,12 +110,12 @@ class ProductsAllSpider(scrapy.Spider):
 
             # If still no options, extract from URL path
             if not options:
-                # Try to find price in the page content
-                price_text = response.css('*::text').re_first(r'\$\d+\.\d{2}')
-                if price_text:
+                # Try to find price in the page content with one scan of the body
+                price_match = _PRICE_RE.search(response.text)
+                if price_match:
                     options.append({
                         "size": "Standard",
-                        "price": price_text
+                        "price": price_match.group(0)
                     })
 
         # Extract ingredients - try multiple methods
@@ -109,15 +132,15 @@ class ProductsAllSpider(scrapy.Spider):
         # Method 2: Try to extract ingredients from product details
         if not ingredients_list:
             # Look for ingredient list pattern in product details
-            details_text = ' '.join(response.css('div.product-full__detail-content::text').getall())
+            details_text = ' '.join(detail_texts)
             if details_text:
                 # Look for ingredient list that typically starts after application instructions
-                ingredients_match = re.search(r'(?:Ingredients:|ingredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)', details_text)
+                ingredients_match = _INGREDIENTS_MARKER in details_text and _INGREDIENTS_RE.search(details_text)
                 if ingredients_match:
                     ingredients_list = [ingredients_match.group(1).strip()]
                 else:
                     # Try to find a list of chemical ingredients
-                    ingredients_match = re.search(r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+', details_text)
+                    ingredients_match = _CHEMICAL_RE.search(details_text)
                     if ingredients_match:
                         ingredients_list = [ingredients_match.group(0).strip()]
 
@@ -127,7 +150,7 @@ class ProductsAllSpider(scrapy.Spider):
         other_info = []
 
         # Try to extract product description
-        description = response.css('div.product-full__description::text').get()
+        description = response.xpath(self._DESCRIPTION_XP).get()
         if description:
             description = description.strip()
             if description:
@@ -141,23 +164,21 @@ class ProductsAllSpider(scrapy.Spider):
                 other_info.append(f"CATEGORY\n{category}")
 
         # Extract any text content that might be useful
-        product_text = response.css('div.product-full__detail-content::text').getall()
-        if product_text:
-            product_text = [t.strip() for t in product_text if t.strip()]
+        if detail_texts:
+            product_text = [t.strip() for t in detail_texts if t.strip()]
             if product_text:
                 # Join the text and clean it up
                 details_text = ' '.join(product_text)
 
                 # Remove ingredient list if present
-                ingredients_pattern = r'(?:Ingredients:|ingredients:)?\s*(Water\\Aqua\\Eau.+?)(?:<|$)'
-                details_text = re.sub(ingredients_pattern, '', details_text)
+                if _INGREDIENTS_MARKER in details_text:
+                    details_text = _INGREDIENTS_RE.sub('', details_text)
 
                 # Remove chemical ingredient lists
-                chemical_pattern = r'(?:[A-Z][a-z]+\s*,\s*){3,}[A-Z][a-z]+'
-                details_text = re.sub(chemical_pattern, '', details_text)
+                details_text = _CHEMICAL_RE.sub('', details_text)
 
                 # Clean up the text
-                details_text = re.sub(r'\s+', ' ', details_text).strip()
+                details_text = _WS_RE.sub(' ', details_text).strip()
 
                 # Add to other info if not empty
                 if details_text:
@@ -13,34 +13,38 @@ class ProductsRawSpider(scrapy.Spider):
         # Optionally throttle for good etiquette
         'DOWNLOAD_DELAY': 1
     }
+    # XPath equivalents of the page selectors, written out once at class scope so
+    # Parsel does not translate CSS to XPath on every response
+    _PRODUCT_LINK_XP = '//a[starts-with(@href, "/product/")]'
+    _NEXT_PAGE_XP = ('//a[contains(concat(" ", normalize-space(@class), " "), " pagination__next ")]/@href'
+                     ' | //a[@rel="next"]/@href')
+    _CATEGORY_LINK_XP = ('//a[starts-with(@href, "/shop-by-concern/")]/@href'
+                         ' | //a[starts-with(@href, "/collections/")]/@href')
+    _OG_TITLE_XP = '//meta[@property="og:title"]/@content'
+    _OG_DESCRIPTION_XP = '//meta[@property="og:description"]/@content'
 
     def parse(self, response):
-        # Find product links on category/listing pages
-        product_links = response.css('a[href^="/product/"]::attr(href)').getall()
-        for link in product_links:
-            url = response.urljoin(link.split('#')[0])  # Remove fragment
+        # Find product links on category/listing pages; the same product is
+        # often linked several times per page, so only request each URL once
+        page_urls = set()
+        for link in response.xpath(self._PRODUCT_LINK_XP):
+            url = response.urljoin(link.attrib.get('href').split('#')[0])  # Remove fragment
+            if url in page_urls:
+                continue
+            page_urls.add(url)
             yield scrapy.Request(url, callback=self.save_raw_product)
 
         # Pagination (if exists)
-        next_page = response.css('a.pagination__next::attr(href), a[rel="next"]::attr(href)').get()
+        next_page = response.xpath(self._NEXT_PAGE_XP).get()
         if next_page:
             yield response.follow(next_page, self.parse)
 
         # Discover category/collection pages from nav/menu if needed (optional)
-        category_links = response.css('a[href^="/shop-by-concern/"]::attr(href), a[href^="/collections/"]::attr(href)').getall()
+        category_links = response.xpath(self._CATEGORY_LINK_XP).getall()
         for link in category_links:
             yield response.follow(link, self.parse)
 
     def save_raw_product(self, response):
-        # Deduplicate using canonical URL
-        canonical = response.css('link[rel="canonical"]::attr(href)').get()
-        if hasattr(self, 'seen'):
-            if canonical in self.seen:
-                return
-            self.seen.add(canonical)
-        else:
-            self.seen = {canonical}
-
         # Extract category from URL path
         url_path = response.url.split('/')
         category = ""
@@ -48,11 +52,11 @@ class ProductsRawSpider(scrapy.Spider):
             category = url_path[-2].replace('-', ' ').title()
 
         # Save raw HTML content for later parsing
-        raw_html = response.body.decode('utf-8')
+        raw_html = response.text
         
         # Extract basic metadata
-        meta_title = response.css('meta[property="og:title"]::attr(content)').get()
-        meta_description = response.css('meta[property="og:description"]::attr(content)').get()
+        meta_title = response.xpath(self._OG_TITLE_XP).get()
+        meta_description = response.xpath(self._OG_DESCRIPTION_XP).get()
         
         # Create a ProductItem with raw data
         product = ProductItem(
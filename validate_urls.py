@@ -18,20 +18,16 @@ Options:
 
 import json
 import os
+import socket
 import sys
-import time
 import argparse
+import asyncio
+import aiohttp
 import requests
 import webbrowser
+from functools import lru_cache
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-# Selenium imports for headless browser testing
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor
 
 
 def load_sources(file_path):
@@ -62,8 +58,36 @@ def validate_url_format(url):
     return True, "Valid URL format"
 
 
-def check_url_with_headless_browser(url, timeout=10):
-    """Check if URL is reachable using a headless browser."""
+# Maximum number of reachability checks in flight at once
+MAX_CONCURRENT_CHECKS = 64
+
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Resolve the ChromeDriver binary once per process."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    # Suppress the ChromeDriverManager output
+    os.environ['WDM_LOG_LEVEL'] = '0'
+    os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
+    return ChromeDriverManager().install()
+
+
+# Chrome instance shared by all headless checks; only ever touched from one thread
+_headless_driver = None
+
+
+def get_headless_driver():
+    """Return the shared headless Chrome driver, starting it on first use."""
+    global _headless_driver
+    if _headless_driver is not None:
+        return _headless_driver
+
+    # Selenium is only needed with --headless, so import it on first use
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
@@ -75,15 +99,32 @@ def check_url_with_headless_browser(url, timeout=10):
     options.add_argument("--log-level=3")
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
-    driver = None
-    try:
-        # Suppress the ChromeDriverManager output
-        os.environ['WDM_LOG_LEVEL'] = '0'
-        os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
+    service = Service(get_chromedriver_path())
+    _headless_driver = webdriver.Chrome(service=service, options=options)
+    return _headless_driver
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+def quit_headless_driver():
+    """Shut down the shared headless Chrome driver, if it was started."""
+    global _headless_driver
+    if _headless_driver is not None:
+        try:
+            _headless_driver.quit()
+        except Exception:
+            # The browser process may already be gone
+            pass
+        _headless_driver = None
+
+
+def check_url_with_headless_browser(url, timeout=10):
+    """Check if URL is reachable using a headless browser."""
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+
+    try:
+        driver = get_headless_driver()
         driver.set_page_load_timeout(timeout)
+        # Start each check without state left over from the previous site
+        driver.delete_all_cookies()
 
         # Navigate to the URL
         driver.get(url)
@@ -115,13 +156,12 @@ def check_url_with_headless_browser(url, timeout=10):
                 pass
             return False, f"Browser error: {error_msg[:100]}..."
         else:
+            # The browser may be unusable now, so start a fresh one for the next check
+            quit_headless_driver()
             return False, f"Browser error: {error_msg[:100]}..."
-    finally:
-        if driver:
-            driver.quit()
 
 
-def check_url_reachable(brand, url, timeout=10):
+async def check_url_reachable(session, brand, url, timeout=10):
     """Check if URL is reachable."""
     # More browser-like headers to avoid detection
     headers = {
@@ -134,11 +174,18 @@ def check_url_reachable(brand, url, timeout=10):
         'Cache-Control': 'max-age=0'
     }
 
-    try:
-        # Try GET request with full headers
-        response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
 
-        status_code = response.status_code
+    try:
+        # A HEAD request is enough to read the status without downloading the page
+        async with session.head(url, timeout=client_timeout,
+                                headers=headers, allow_redirects=True) as response:
+            status_code = response.status
+        if status_code >= 400:
+            # Some servers reject or mishandle HEAD, so confirm with a GET whose body is never read
+            async with session.get(url, timeout=client_timeout,
+                                   headers=headers, allow_redirects=True) as response:
+                status_code = response.status
         if 200 <= status_code < 300:
             return True, f"Status code: {status_code}"
         elif status_code == 403:
@@ -146,11 +193,18 @@ def check_url_reachable(brand, url, timeout=10):
             return False, f"Status code: 403 (May be bot protection - try browser)"
         else:
             return False, f"Status code: {status_code}"
-    except requests.RequestException as e:
+    except asyncio.TimeoutError:
+        return False, f"Request timeout after {timeout}s"
+    except aiohttp.ClientConnectorError as e:
+        if isinstance(e.os_error, socket.gaierror):
+            return False, f"Failed to resolve host: {e}"
+        return False, str(e)
+    except aiohttp.ClientError as e:
         return False, str(e)
 
 
-def validate_source(source, check_reachable=False, timeout=10, verbose=False, browser_check=False, use_headless=False):
+async def validate_source(session, source, check_reachable=False, timeout=10, verbose=False,
+                          browser_check=False, use_headless=False, browser_executor=None):
     """Validate a single source."""
     brand = source.get('brand', 'Unknown')
     url = source.get('url', '')
@@ -167,7 +221,7 @@ def validate_source(source, check_reachable=False, timeout=10, verbose=False, br
 
     # Check if URL is reachable
     if check_reachable:
-        reachable, reachable_message = check_url_reachable(brand, url, timeout)
+        reachable, reachable_message = await check_url_reachable(session, brand, url, timeout)
 
         # If initial check fails and headless browser option is enabled, try with headless browser
         if not reachable and use_headless and ("403" in reachable_message or
@@ -176,7 +230,10 @@ def validate_source(source, check_reachable=False, timeout=10, verbose=False, br
             if verbose:
                 print(f"🔄 {brand}: Retrying with headless browser - {url}")
 
-            headless_reachable, headless_message = check_url_with_headless_browser(url, timeout)
+            # Selenium is blocking, so run it off the event loop
+            loop = asyncio.get_running_loop()
+            headless_reachable, headless_message = await loop.run_in_executor(
+                browser_executor, check_url_with_headless_browser, url, timeout)
 
             if headless_reachable:
                 if verbose:
@@ -203,6 +260,33 @@ def validate_source(source, check_reachable=False, timeout=10, verbose=False, br
     return True, None
 
 
+async def validate_sources(sources, check_reachable=False, timeout=10, verbose=False,
+                           browser_check=False, use_headless=False):
+    """Validate all sources, checking reachability concurrently over one pooled session."""
+    if not check_reachable:
+        # Format checks make no requests, so no session is needed
+        return [await validate_source(None, source, False, timeout, verbose) for source in sources]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    # Headless checks share one Chrome driver, which is not thread-safe, so they run on one thread
+    browser_executor = ThreadPoolExecutor(max_workers=1) if use_headless else None
+
+    async def check(session, source):
+        async with semaphore:
+            return await validate_source(session, source, True, timeout, verbose,
+                                         browser_check, use_headless, browser_executor)
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_CHECKS)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(check(session, source) for source in sources),
+                                        return_exceptions=True)
+    finally:
+        if browser_executor:
+            browser_executor.shutdown()
+            quit_headless_driver()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate URLs in sources.json')
     parser.add_argument('--check-reachable', action='store_true', help='Check if URLs are reachable')
@@ -227,50 +311,28 @@ def main():
     invalid_count = 0
     browser_check_urls = []
 
-    if args.check_reachable:
-        # Use ThreadPoolExecutor for parallel requests
-        with ThreadPoolExecutor(max_workers=5 if args.headless else 10) as executor:
-            futures = {
-                executor.submit(
-                    validate_source,
-                    source,
-                    args.check_reachable,
-                    args.timeout,
-                    args.verbose,
-                    args.browser_check,
-                    args.headless
-                ): source
-                for source in sources
-            }
-
-            for future in as_completed(futures):
-                source = futures[future]
-                try:
-                    result, browser_check_info = future.result()
-                    if result:
-                        valid_count += 1
-                    else:
-                        invalid_count += 1
-                        if browser_check_info:
-                            browser_check_urls.append(browser_check_info)
-                except Exception as e:
-                    print(f"❌ {source.get('brand', 'Unknown')}: Error - {str(e)}")
-                    invalid_count += 1
-    else:
-        # Sequential validation for format only
-        for source in sources:
-            result, _ = validate_source(
-                source,
-                args.check_reachable,
-                args.timeout,
-                args.verbose,
-                args.browser_check,
-                args.headless
-            )
-            if result:
-                valid_count += 1
-            else:
-                invalid_count += 1
+    # Reachability checks run concurrently inside one event loop
+    results = asyncio.run(validate_sources(
+        sources,
+        args.check_reachable,
+        args.timeout,
+        args.verbose,
+        args.browser_check,
+        args.headless
+    ))
+
+    for source, outcome in zip(sources, results):
+        if isinstance(outcome, Exception):
+            print(f"❌ {source.get('brand', 'Unknown')}: Error - {str(outcome)}")
+            invalid_count += 1
+            continue
+        result, browser_check_info = outcome
+        if result:
+            valid_count += 1
+        else:
+            invalid_count += 1
+            if browser_check_info:
+                browser_check_urls.append(browser_check_info)
 
     # Print summary
     print(f"\nValidation complete: {valid_count} valid, {invalid_count} invalid URLs")
@@ -293,8 +355,7 @@ def main():
         print("\nOpening problematic URLs in browser for manual verification...")
         for brand, url, error in browser_check_urls:
             print(f"Opening {brand}: {url} ({error})")
-            webbrowser.open(url)
-            time.sleep(1)  # Pause between opening URLs to avoid overwhelming the browser
+            webbrowser.open_new_tab(url)
 
     # Return non-zero exit code if any URLs are invalid
     return 0 if invalid_count == 0 else 1